@@ -1,11 +1,32 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, JSON, ForeignKey, Index, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Float, JSON, LargeBinary, ForeignKey, Index, Enum, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
+import zlib
+
+import orjson
 
 from ..core.database import Base
 
 
+def compress_json(value):
+    """Encode a JSON-serializable value for a compressed BLOB column.
+
+    ESPN box-score payloads compress ~8x, which cuts the WAL bytes the
+    bulk ingests write per stat row by the same factor.
+    """
+    if value is None:
+        return None
+    return zlib.compress(orjson.dumps(value), 6)
+
+
+def decompress_json(blob):
+    """Decode a value written by compress_json"""
+    if blob is None:
+        return None
+    return orjson.loads(zlib.decompress(blob))
+
+
 class League(enum.Enum):
     NFL = "NFL"
     CFL = "CFL"
@@ -80,10 +101,22 @@ class Game(Base):
     __table_args__ = (
         Index('idx_game_date', 'game_datetime'),
         Index('idx_game_season_week', 'season', 'week'),
+        Index('idx_game_season_type', 'season', 'game_type'),
         Index('idx_game_teams', 'home_team_uid', 'away_team_uid'),
+        # Composite indexes serving the audit's season + date-window filters
+        # and the duplicate-game detection GROUP BY
+        Index('idx_game_season_dt_type', 'season', 'game_datetime', 'game_type'),
+        Index('idx_game_season_teams_dt', 'season', 'home_team_uid',
+              'away_team_uid', 'game_datetime'),
     )
 
 
+# Expression index so combined-score checks can seek instead of computing
+# home_score + away_score per row (declared here because the expression
+# needs the mapped columns, which don't exist inside the class body)
+Index('idx_game_total_score', Game.home_score + Game.away_score)
+
+
 class Player(Base):
     __tablename__ = "players"
     
@@ -161,22 +194,37 @@ class TeamGameStat(Base):
     penalties = Column(Integer)
     penalty_yards = Column(Integer)
     
-    # Raw ESPN data
-    raw_box_score = Column(JSON)
-    
+    # Raw ESPN data, zlib-compressed JSON (multi-KB per row as plain text;
+    # the blob dominates the table's size and write volume otherwise)
+    raw_box_score_zlib = Column(LargeBinary)
+
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     source = Column(String)
-    
+
     # Relationships
     game = relationship("Game")
     team = relationship("Team")
+
+    @property
+    def raw_box_score(self):
+        """Lazily decompressed view of the raw ESPN box score"""
+        return decompress_json(self.raw_box_score_zlib)
+
+    @raw_box_score.setter
+    def raw_box_score(self, value):
+        self.raw_box_score_zlib = compress_json(value)
     
     # Indexes
     __table_args__ = (
         Index('idx_team_game_stat', 'team_uid', 'game_uid'),
-        Index('idx_game_team_stat', 'game_uid', 'team_uid'),
+        # Unique: one stat row per team per game. Makes the existence probe
+        # an index-only lookup and lets writers use INSERT OR IGNORE
+        Index('idx_game_team_stat', 'game_uid', 'team_uid', unique=True),
+        # Partial index keeps the audit's total_yards coverage check index-only
+        Index('idx_stat_total_yards', 'total_yards',
+              sqlite_where=text('total_yards IS NOT NULL')),
     )
 
 
@@ -9,16 +9,61 @@ from backend.app.scrapers.pro_football_reference_fixed import ProFootballReferen
 from backend.boxscore_scraper import BoxscoreScraper
 from backend.app.core.database import SessionLocal
 from backend.app.models import Game, League, Team
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import selectinload
+import argparse
+import functools
 import logging
 import json
+import queue
+import threading
 import time
+import orjson
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 import os
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SLOW_QUERY_THRESHOLD = 0.1  # seconds
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _query_start_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _log_slow_queries(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop(-1)
+    if elapsed > SLOW_QUERY_THRESHOLD:
+        logger.warning(f"Slow query ({elapsed * 1000:.0f} ms): {statement[:200]}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_date(dt) -> str:
+    """Memoized datetime -> 'YYYY-MM-DD'; the same kickoff shows up in several payloads"""
+    return dt.date().isoformat() if dt else None
+
+
+def _count_json(directory) -> int:
+    """Count *.json files in a directory without the Path.glob overhead"""
+    if not os.path.isdir(directory):
+        return 0
+    return sum(1 for entry in os.scandir(directory) if entry.name.endswith(".json"))
+
+
+def _iter_json(directory):
+    """Yield str paths of *.json files in a directory (cheaper than Path.glob)"""
+    if not os.path.isdir(directory):
+        return
+    for entry in os.scandir(directory):
+        if entry.name.endswith(".json"):
+            yield os.path.join(directory, entry.name)
+
 
 class IntegratedSeasonScraper:
     """Complete NFL season data scraping workflow"""
@@ -29,16 +74,43 @@ class IntegratedSeasonScraper:
         self.boxscore_scraper = None
         self.data_dir = Path("season_data")
         self.data_dir.mkdir(exist_ok=True)
-        
+        # Background writer so disk I/O overlaps the next network fetch
+        self._write_q = queue.Queue(maxsize=32)
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
     def __enter__(self):
         return self
-        
+
     def __exit__(self, exc_type, exc_val, exc_tb):
+        # Flush pending writes before tearing anything down
+        self._write_q.put(None)
+        self._writer.join()
         if self.schedule_scraper:
             self.schedule_scraper.close()
         if self.boxscore_scraper:
             self.boxscore_scraper.close()
         self.db.close()
+
+    def _writer_loop(self):
+        """Drain the write queue, writing serialized JSON payloads to disk"""
+        while True:
+            item = self._write_q.get()
+            if item is None:
+                self._write_q.task_done()
+                break
+            path, payload = item
+            try:
+                with open(path, 'wb') as f:
+                    f.write(payload)
+            except Exception as e:
+                logger.error(f"Failed to write {path}: {e}")
+            finally:
+                self._write_q.task_done()
+
+    def _enqueue_json(self, path, obj: dict):
+        """Serialize obj to pretty-printed JSON bytes and hand it to the writer thread"""
+        self._write_q.put((str(path), orjson.dumps(obj, option=orjson.OPT_INDENT_2)))
     
     def get_available_seasons(self) -> dict:
         """Get available seasons and their data status"""
@@ -54,7 +126,7 @@ class IntegratedSeasonScraper:
             
             # Check for detailed data
             detailed_data_dir = self.data_dir / f"season_{season}" / "boxscores"
-            detailed_games = len(list(detailed_data_dir.glob("*.json"))) if detailed_data_dir.exists() else 0
+            detailed_games = _count_json(detailed_data_dir)
             
             seasons_info[season] = {
                 "total_games": total_games,
@@ -74,9 +146,10 @@ class IntegratedSeasonScraper:
             Game.season == season,
             Game.source == 'pro_football_reference'
         ).all()
-        
+        total = len(games)
+
         validation_results = {
-            "total_games": len(games),
+            "total_games": total,
             "games_with_results": 0,
             "games_missing_teams": 0,
             "duplicate_game_ids": [],
@@ -133,8 +206,8 @@ class IntegratedSeasonScraper:
         logger.info("Step 1: Validating schedule data...")
         validation = self.validate_season_data(season)
         
-        with open(season_dir / "validation_report.json", 'w') as f:
-            json.dump(validation, f, indent=2)
+        with open(season_dir / "validation_report.json", 'wb') as f:
+            f.write(orjson.dumps(validation, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Season {season} validation:")
         logger.info(f"  Total games: {validation['total_games']}")
@@ -168,7 +241,12 @@ class IntegratedSeasonScraper:
     
     def _export_season_schedule(self, season: int, season_dir: Path):
         """Export season schedule to CSV"""
-        games = self.db.query(Game).filter(
+        games = self.db.query(Game).options(
+            # Eager-load both team relationships in one IN-query each;
+            # lazy loading would issue two SELECTs per game below
+            selectinload(Game.home_team),
+            selectinload(Game.away_team)
+        ).filter(
             Game.league == League.NFL,
             Game.season == season,
             Game.source == 'pro_football_reference'
@@ -181,11 +259,9 @@ class IntegratedSeasonScraper:
             game_time = None
             
             if game.game_datetime:
+                game_date = _iso_date(game.game_datetime)
                 # Show just date if we don't have real kickoff time (fake 12:00:00 timestamps)
-                if game.game_datetime.hour == 12 and game.game_datetime.minute == 0:
-                    game_date = game.game_datetime.date().isoformat()
-                else:
-                    game_date = game.game_datetime.date().isoformat()
+                if not (game.game_datetime.hour == 12 and game.game_datetime.minute == 0):
                     game_time = game.game_datetime.time().isoformat()
             
             schedule_data.append({
@@ -220,8 +296,11 @@ class IntegratedSeasonScraper:
         for dir_path in [boxscores_dir, team_stats_dir, player_stats_dir, expected_points_dir]:
             dir_path.mkdir(exist_ok=True)
         
-        # Get games to scrape
-        games_query = self.db.query(Game).filter(
+        # Get games to scrape (team names are logged per game, so eager-load them)
+        games_query = self.db.query(Game).options(
+            selectinload(Game.home_team),
+            selectinload(Game.away_team)
+        ).filter(
             Game.league == League.NFL,
             Game.season == season,
             Game.source == 'pro_football_reference'
@@ -231,7 +310,8 @@ class IntegratedSeasonScraper:
             games_query = games_query.limit(max_games)
         
         games = games_query.all()
-        logger.info(f"Scraping detailed data for {len(games)} games from {season}")
+        total = len(games)
+        logger.info(f"Scraping detailed data for {total} games from {season}")
         
         if not self.boxscore_scraper:
             self.boxscore_scraper = BoxscoreScraper(headless=True)
@@ -242,7 +322,7 @@ class IntegratedSeasonScraper:
         
         for i, game in enumerate(games, 1):
             try:
-                logger.info(f"Processing game {i}/{len(games)}: {game.game_uid}")
+                logger.info(f"Processing game {i}/{total}: {game.game_uid}")
                 logger.info(f"  {game.away_team.name if game.away_team else 'Unknown'} @ {game.home_team.name if game.home_team else 'Unknown'}")
                 
                 # Check if already scraped
@@ -256,10 +336,9 @@ class IntegratedSeasonScraper:
                 boxscore_data = self.boxscore_scraper.scrape_detailed_boxscore(game.game_uid)
                 
                 if boxscore_data:
-                    # Save complete boxscore
-                    with open(boxscore_file, 'w') as f:
-                        json.dump(boxscore_data, f, indent=2)
-                    
+                    # Save complete boxscore (written by the background thread)
+                    self._enqueue_json(boxscore_file, boxscore_data)
+
                     # Extract and save organized data
                     self._save_organized_game_data(game, boxscore_data, season_dir)
                     
@@ -274,7 +353,7 @@ class IntegratedSeasonScraper:
                 
                 # Progress updates
                 if i % 10 == 0:
-                    logger.info(f"Progress: {i}/{len(games)} processed")
+                    logger.info(f"Progress: {i}/{total} processed")
                 
             except Exception as e:
                 logger.error(f"Error processing game {game.game_uid}: {e}")
@@ -282,7 +361,7 @@ class IntegratedSeasonScraper:
                 continue
         
         results = {
-            "total_games": len(games),
+            "total_games": total,
             "successfully_scraped": successfully_scraped,
             "failed_scrapes": failed_scrapes,
             "skipped_existing": skipped_existing
@@ -303,7 +382,7 @@ class IntegratedSeasonScraper:
             "season": game.season,
             "week": game.week,
             "game_type": game.game_type,
-            "date": game.game_datetime.date().isoformat() if game.game_datetime else None,
+            "date": _iso_date(game.game_datetime),
             "home_team": game.home_team.name if game.home_team else None,
             "away_team": game.away_team.name if game.away_team else None,
             "home_team_uid": game.home_team_uid,
@@ -313,29 +392,33 @@ class IntegratedSeasonScraper:
             "scraped_at": datetime.utcnow().isoformat()
         }
         
+        # Reuse the game_info dict for every payload: _enqueue_json serializes
+        # synchronously, so we can add one key per write and drop it afterwards
+        # instead of rebuilding the full dict three times.
+
         # Save team stats
         team_stats = boxscore_data.get('team_stats', {})
         if team_stats:
-            team_stats_data = {**game_info, "team_stats": team_stats}
+            game_info["team_stats"] = team_stats
             team_stats_file = season_dir / "team_stats" / f"{game.game_uid}_team_stats.json"
-            with open(team_stats_file, 'w') as f:
-                json.dump(team_stats_data, f, indent=2)
-        
+            self._enqueue_json(team_stats_file, game_info)
+            del game_info["team_stats"]
+
         # Save expected points if available
         expected_points = team_stats.get('expected_points', [])
         if expected_points:
-            ep_data = {**game_info, "expected_points": expected_points}
+            game_info["expected_points"] = expected_points
             ep_file = season_dir / "expected_points" / f"{game.game_uid}_expected_points.json"
-            with open(ep_file, 'w') as f:
-                json.dump(ep_data, f, indent=2)
-        
+            self._enqueue_json(ep_file, game_info)
+            del game_info["expected_points"]
+
         # Save player stats
         player_stats = boxscore_data.get('player_stats', {})
         if player_stats:
-            player_data = {**game_info, "player_stats": player_stats}
+            game_info["player_stats"] = player_stats
             player_file = season_dir / "player_stats" / f"{game.game_uid}_player_stats.json"
-            with open(player_file, 'w') as f:
-                json.dump(player_data, f, indent=2)
+            self._enqueue_json(player_file, game_info)
+            del game_info["player_stats"]
     
     def _create_season_summary(self, season: int, season_dir: Path, validation: dict, detailed_results: dict):
         """Create comprehensive season summary"""
@@ -357,15 +440,15 @@ class IntegratedSeasonScraper:
         
         # Count actual files created
         summary["file_counts"] = {
-            "boxscores": len(list((season_dir / "boxscores").glob("*.json"))),
-            "team_stats": len(list((season_dir / "team_stats").glob("*.json"))),
-            "player_stats": len(list((season_dir / "player_stats").glob("*.json"))),
-            "expected_points": len(list((season_dir / "expected_points").glob("*.json")))
+            "boxscores": _count_json(season_dir / "boxscores"),
+            "team_stats": _count_json(season_dir / "team_stats"),
+            "player_stats": _count_json(season_dir / "player_stats"),
+            "expected_points": _count_json(season_dir / "expected_points")
         }
         
         # Save summary
-        with open(season_dir / "season_summary.json", 'w') as f:
-            json.dump(summary, f, indent=2)
+        with open(season_dir / "season_summary.json", 'wb') as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
         
         # Create CSV summaries for easy viewing
         self._create_csv_summaries(season, season_dir)
@@ -374,7 +457,7 @@ class IntegratedSeasonScraper:
         """Create CSV summary files from JSON data"""
         
         # Team stats summary
-        team_stats_files = list((season_dir / "team_stats").glob("*.json"))
+        team_stats_files = list(_iter_json(season_dir / "team_stats"))
         if team_stats_files:
             team_data = []
             
@@ -394,10 +477,10 @@ class IntegratedSeasonScraper:
                 # Add expected points if available
                 ep_data = data.get("team_stats", {}).get("expected_points", [])
                 if len(ep_data) >= 2:
+                    side_of = {data.get("home_team"): "home", data.get("away_team"): "away"}
                     for i, team_ep in enumerate(ep_data):
-                        team_name = team_ep.get("", "")
-                        prefix = "home" if team_name == data.get("home_team") else "away"
-                        
+                        prefix = side_of.get(team_ep.get("", ""), "away")
+
                         base_row.update({
                             f"{prefix}_expected_points_offense": team_ep.get("Offense"),
                             f"{prefix}_expected_points_defense": team_ep.get("Defense"),
@@ -411,7 +494,7 @@ class IntegratedSeasonScraper:
                 df.to_csv(season_dir / f"team_stats_summary_{season}.csv", index=False)
         
         # Games summary with metadata
-        boxscore_files = list((season_dir / "boxscores").glob("*.json"))
+        boxscore_files = list(_iter_json(season_dir / "boxscores"))
         if boxscore_files:
             games_summary = []
             
@@ -439,73 +522,75 @@ class IntegratedSeasonScraper:
                 df.to_csv(season_dir / f"detailed_games_summary_{season}.csv", index=False)
 
 
+def _run_season(season: int, force_refresh: bool, max_games: int = None):
+    """Scrape one season in its own scraper/DB session (process-pool friendly)"""
+    with IntegratedSeasonScraper() as scraper:
+        result = scraper.scrape_complete_season(season, force_refresh, max_games)
+    print(f"✅ Season {season} complete! Data in: {result['data_directory']}")
+    return result
+
+
 def main():
-    """Main interactive function"""
+    """CLI entry point - non-interactive so seasons can run in cron/CI or in parallel"""
+    parser = argparse.ArgumentParser(description="NFL Integrated Season Data Scraper")
+    parser.add_argument("--season", type=int, action="append",
+                        help="Season to scrape (repeatable); defaults to 2022-2024")
+    parser.add_argument("--max-games", type=int, default=None,
+                        help="Maximum games to process for detailed scraping")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Max seasons scraped in parallel processes")
+    parser.add_argument("--force", action="store_true",
+                        help="Force refresh existing data")
+    parser.add_argument("--validate-only", action="store_true",
+                        help="Only run validation for the selected seasons")
+    parser.add_argument("--status", action="store_true",
+                        help="Show current data status and exit")
+    args = parser.parse_args()
+
+    seasons = args.season or [2022, 2023, 2024]
+
     print("🏈 NFL Integrated Season Data Scraper")
     print("=====================================")
-    
+
     try:
-        with IntegratedSeasonScraper() as scraper:
-            
-            # Show current status
-            seasons_info = scraper.get_available_seasons()
+        if args.status:
+            with IntegratedSeasonScraper() as scraper:
+                seasons_info = scraper.get_available_seasons()
             print("\n📊 Current Data Status:")
             for season, info in seasons_info.items():
                 print(f"  {season}: {info['total_games']} games in DB, {info['detailed_games']} detailed ({info['completion_rate']})")
-            
-            # Season selection
-            print("\n🎯 Season Selection:")
-            print("1. 2024 season (most recent)")
-            print("2. 2023 season")
-            print("3. 2022 season")
-            print("4. All seasons (2022-2024)")
-            print("5. Custom season validation only")
-            
-            choice = input("\nEnter your choice (1-5): ").strip()
-            
-            # Processing options
-            print("\n⚙️  Processing Options:")
-            max_games = input("Maximum games to process for detailed scraping (press Enter for all): ").strip()
-            max_games = int(max_games) if max_games.isdigit() else None
-            
-            force_refresh = input("Force refresh existing data? (y/N): ").strip().lower() == 'y'
-            
-            # Execute based on choice
-            if choice == "1":
-                result = scraper.scrape_complete_season(2024, force_refresh, max_games)
-                print(f"\n✅ Season 2024 complete! Data in: {result['data_directory']}")
-                
-            elif choice == "2":
-                result = scraper.scrape_complete_season(2023, force_refresh, max_games)
-                print(f"\n✅ Season 2023 complete! Data in: {result['data_directory']}")
-                
-            elif choice == "3":
-                result = scraper.scrape_complete_season(2022, force_refresh, max_games)
-                print(f"\n✅ Season 2022 complete! Data in: {result['data_directory']}")
-                
-            elif choice == "4":
-                print("\n🔄 Processing all seasons...")
-                for season in [2022, 2023, 2024]:
-                    print(f"\n--- Processing {season} ---")
-                    result = scraper.scrape_complete_season(season, force_refresh, max_games)
-                    print(f"✅ Season {season} complete!")
-                print(f"\n🎉 All seasons processed! Data in: {scraper.data_dir.absolute()}")
-                
-            elif choice == "5":
-                season = input("Enter season to validate (2022-2024): ").strip()
-                if season.isdigit() and int(season) in [2022, 2023, 2024]:
-                    validation = scraper.validate_season_data(int(season))
+            return
+
+        if args.validate_only:
+            with IntegratedSeasonScraper() as scraper:
+                for season in seasons:
+                    validation = scraper.validate_season_data(season)
                     print(f"\n📋 Validation Results for {season}:")
                     print(f"  Total games: {validation['total_games']}")
                     print(f"  Games with results: {validation['games_with_results']}")
                     print(f"  Games by type: {validation['games_by_type']}")
                     if validation['duplicate_game_ids']:
                         print(f"  ⚠️  Duplicates found: {len(validation['duplicate_game_ids'])}")
-                else:
-                    print("❌ Invalid season")
-            else:
-                print("❌ Invalid choice")
-                
+            return
+
+        if len(seasons) == 1:
+            _run_season(seasons[0], args.force, args.max_games)
+        else:
+            # Each season gets its own process (and therefore its own DB session
+            # and scraper), so multiple seasons overlap instead of running serially
+            workers = min(args.concurrency, len(seasons))
+            print(f"\n🔄 Processing {len(seasons)} seasons with {workers} workers...")
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(_run_season, season, args.force, args.max_games): season
+                           for season in seasons}
+                for future in as_completed(futures):
+                    season = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Season {season} failed: {e}")
+            print("\n🎉 All seasons processed!")
+
     except KeyboardInterrupt:
         print("\n\n⏹️  Scraping interrupted by user")
     except Exception as e:
@@ -8,62 +8,66 @@ sys.path.append(str(Path(__file__).parent.parent))
 from backend.app.ingestion.thesportsdb import TheSportsDBClient
 from backend.app.models import Team, League
 from backend.app.core.database import SessionLocal
+from sqlalchemy import bindparam, select, update
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fields that must never be overwritten on an existing row
+_SKIP_FIELDS = frozenset({"team_uid", "created_at"})
+
 
 def ingest_all_nfl_teams():
     """Ingest all NFL teams"""
     client = TheSportsDBClient()
-    db = SessionLocal()
-    
+
     try:
         # Get all NFL teams
         logger.info("Fetching all NFL teams from TheSportsDB...")
         teams_data = client.get_all_teams("NFL")
         logger.info(f"Found {len(teams_data)} teams")
-        
-        added_count = 0
-        updated_count = 0
-        
-        # Transform and save each team
-        for tsdb_team in teams_data:
-            team_data = client.transform_team_data(tsdb_team, League.NFL)
-            
-            # Check if team already exists
-            existing_team = db.query(Team).filter(Team.team_uid == team_data["team_uid"]).first()
-            if existing_team:
-                # Update existing team
-                for field, value in team_data.items():
-                    if field not in ['team_uid', 'created_at']:
-                        setattr(existing_team, field, value)
-                updated_count += 1
-                logger.info(f"Updated team: {existing_team.name}")
-            else:
-                # Create new team
-                team = Team(**team_data)
-                db.add(team)
-                added_count += 1
-                logger.info(f"Added team: {team.name}")
-        
-        db.commit()
-        logger.info(f"Teams ingestion completed! Added: {added_count}, Updated: {updated_count}")
-        
-        # Query and display teams
-        teams = db.query(Team).filter(Team.league == League.NFL).all()
-        logger.info(f"\nTotal NFL teams in database: {len(teams)}")
-        for team in teams:
-            logger.info(f"  - {team.city} {team.name} (ID: {team.team_uid})")
-            
+
+        # Transform everything up front, then write in two batched statements
+        # instead of a SELECT + INSERT/UPDATE round trip per team
+        rows = [client.transform_team_data(tsdb_team, League.NFL) for tsdb_team in teams_data]
+        update_fields = tuple(f for f in rows[0] if f not in _SKIP_FIELDS)
+
+        # One session, one explicit transaction; the context managers handle
+        # commit/rollback and close, and autoflush stays off for the reads
+        with SessionLocal() as db:
+            with db.begin(), db.no_autoflush:
+                # Preload every existing uid once; membership tests are then O(1)
+                existing = {uid for (uid,) in db.execute(select(Team.team_uid))}
+                new_rows = [row for row in rows if row["team_uid"] not in existing]
+                update_rows = [
+                    {"b_uid": row["team_uid"], **{f: row[f] for f in update_fields}}
+                    for row in rows if row["team_uid"] in existing
+                ]
+
+                if new_rows:
+                    db.execute(Team.__table__.insert(), new_rows)
+                if update_rows:
+                    stmt = update(Team).where(Team.team_uid == bindparam("b_uid")).values(
+                        {f: bindparam(f) for f in update_fields}
+                    )
+                    db.execute(stmt, update_rows)
+
+            logger.info(f"Teams ingestion completed! Added: {len(new_rows)}, Updated: {len(update_rows)}")
+
+            # Query and display teams - only the three columns we log, no ORM hydration
+            teams = db.execute(
+                select(Team.city, Team.name, Team.team_uid).where(Team.league == League.NFL)
+            ).all()
+            logger.info(f"\nTotal NFL teams in database: {len(teams)}")
+            for city, name, team_uid in teams:
+                logger.info(f"  - {city} {name} (ID: {team_uid})")
+
     except Exception as e:
         logger.error(f"Error during ingestion: {e}")
-        db.rollback()
         raise
     finally:
         client.close()
-        db.close()
 
 
 if __name__ == "__main__":
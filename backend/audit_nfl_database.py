@@ -15,8 +15,12 @@ Usage:
 """
 
 import argparse
+import functools
+import io
 import sys
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -25,7 +29,121 @@ sys.path.append(str(Path(__file__).parent))
 
 from app.core.database import SessionLocal
 from app.models.sports import Team, Game, TeamGameStat, TeamSeasonStat
-from sqlalchemy import extract, func, and_
+from sqlalchemy import bindparam, case, exists, extract, func, select, and_, or_
+from sqlalchemy.orm import aliased
+
+# Shared expanding bind for the season filter: every audit reuses the same
+# compiled statement shape instead of interpolating a fresh IN list per call
+SEASONS_PARAM = bindparam("seasons", expanding=True)
+
+# Season-filtered quality checks with no per-call literals, built once at
+# import so the compiled-statement cache serves every run
+_DUPLICATE_SETS_STMT = select(func.count()).select_from(
+    select(Game.home_team_uid).where(
+        Game.season.in_(SEASONS_PARAM)
+    ).group_by(
+        Game.home_team_uid,
+        Game.away_team_uid,
+        Game.game_datetime
+    ).having(func.count(Game.game_uid) > 1).subquery()
+)
+
+_SELF_PLAYING_STMT = select(exists().where(
+    Game.season.in_(SEASONS_PARAM),
+    Game.home_team_uid == Game.away_team_uid
+))
+
+_HIGH_SCORING_STMT = select(func.count()).select_from(Game).where(
+    Game.season.in_(SEASONS_PARAM),
+    and_(
+        Game.home_score.isnot(None),
+        Game.away_score.isnot(None),
+        # Cheap per-column gate prunes almost every row before the summed
+        # comparison; idx_game_total_score serves the sum itself
+        or_(Game.home_score > 50, Game.away_score > 50),
+        (Game.home_score + Game.away_score) > 100
+    )
+)
+
+_HIGH_ATTENDANCE_STMT = select(exists().where(
+    Game.season.in_(SEASONS_PARAM),
+    Game.attendance > 150000  # No stadium has this capacity
+))
+
+_NO_SCORE_STMT = select(func.count()).select_from(Game).where(
+    Game.season.in_(SEASONS_PARAM),
+    Game.game_datetime < func.now(),  # Past games, per the DB clock
+    and_(
+        Game.home_score.is_(None),
+        Game.away_score.is_(None)
+    )
+)
+
+# Anti-join on both FK sides: one pass over games with two index-backed
+# lookups, flagging a game when EITHER reference is broken (the old double
+# NOT IN ran two subplans and only caught games where both were invalid)
+_HOME_TEAM = aliased(Team)
+_AWAY_TEAM = aliased(Team)
+
+_INVALID_TEAMS_STMT = select(func.count()).select_from(Game).outerjoin(
+    _HOME_TEAM, Game.home_team_uid == _HOME_TEAM.team_uid
+).outerjoin(
+    _AWAY_TEAM, Game.away_team_uid == _AWAY_TEAM.team_uid
+).where(
+    Game.season.in_(SEASONS_PARAM),
+    or_(
+        and_(Game.home_team_uid.isnot(None), _HOME_TEAM.team_uid.is_(None)),
+        and_(Game.away_team_uid.isnot(None), _AWAY_TEAM.team_uid.is_(None))
+    )
+)
+
+
+class _ThreadAwareStdout(io.TextIOBase):
+    """Routes print() to a per-thread buffer when one is installed.
+
+    Lets the audits run concurrently without interleaving their output;
+    threads without a buffer write straight through to the real stdout.
+    """
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self._local = threading.local()
+
+    def set_buffer(self, buf):
+        self._local.buf = buf
+
+    def write(self, s):
+        return (getattr(self._local, "buf", None) or self.fallback).write(s)
+
+    def flush(self):
+        (getattr(self._local, "buf", None) or self.fallback).flush()
+
+
+@functools.lru_cache(maxsize=1)
+def _team_index():
+    """Team display fields keyed by uid, loaded once per audit run.
+
+    32 rows fit trivially in memory; cleared in main() so a long-lived
+    process never serves stale names.
+    """
+    with SessionLocal() as db:
+        return {
+            t["team_uid"]: t
+            for t in db.execute(
+                select(Team.team_uid, Team.city, Team.name)
+            ).mappings()
+        }
+
+
+def _outside_august(season):
+    """Sargable 'not preseason' predicate for one season.
+
+    extract('month', ...) == 8 applies a function to the column and defeats
+    any index on game_datetime; comparing against the half-open
+    [Aug 1, Sep 1) window keeps the filter index-friendly.
+    """
+    return or_(Game.game_datetime < datetime(season, 8, 1),
+               Game.game_datetime >= datetime(season, 9, 1))
 
 def audit_teams():
     """Audit team data for completeness and consistency"""
@@ -36,55 +154,60 @@ def audit_teams():
     issues = []
     
     with SessionLocal() as db:
-        teams = db.query(Team).all()
-        
-        print(f"Total teams in database: {len(teams)}")
-        
-        # Check for missing essential data
-        teams_missing_city = [t for t in teams if not t.city]
-        teams_missing_name = [t for t in teams if not t.name]
-        teams_missing_abbreviation = [t for t in teams if not t.abbreviation]
-        teams_missing_stadium = [t for t in teams if not t.stadium_name]
-        teams_missing_capacity = [t for t in teams if not t.stadium_capacity]
-        teams_missing_coordinates = [t for t in teams if not t.latitude or not t.longitude]
-        teams_missing_conference = [t for t in teams if not t.conference]
-        teams_missing_division = [t for t in teams if not t.division]
-        
-        # Report issues
-        if teams_missing_city:
-            issues.append(f"Teams missing city: {[t.team_uid for t in teams_missing_city]}")
-        
-        if teams_missing_name:
-            issues.append(f"Teams missing name: {[t.team_uid for t in teams_missing_name]}")
-        
-        if teams_missing_abbreviation:
-            issues.append(f"Teams missing abbreviation: {[t.team_uid for t in teams_missing_abbreviation]}")
-        
-        if teams_missing_stadium:
-            issues.append(f"Teams missing stadium: {[t.team_uid for t in teams_missing_stadium]}")
-        
-        if teams_missing_capacity:
-            issues.append(f"Teams missing capacity: {[t.team_uid for t in teams_missing_capacity]}")
-        
-        if teams_missing_coordinates:
-            issues.append(f"Teams missing coordinates: {[t.team_uid for t in teams_missing_coordinates]}")
-        
-        if teams_missing_conference:
-            issues.append(f"Teams missing conference: {[t.team_uid for t in teams_missing_conference]}")
-        
-        if teams_missing_division:
-            issues.append(f"Teams missing division: {[t.team_uid for t in teams_missing_division]}")
-        
+        total_teams = db.execute(select(func.count()).select_from(Team)).scalar()
+        thesportsdb_teams = db.execute(
+            select(func.count()).select_from(Team).where(Team.team_uid.like("NFL_%"))
+        ).scalar()
+
+        print(f"Total teams in database: {total_teams}")
+
+        # Only pull the rows that are actually missing something; the DB
+        # filters, Python just classifies the offenders in one pass
+        incomplete_teams = db.execute(select(
+            Team.team_uid, Team.city, Team.name, Team.abbreviation,
+            Team.stadium_name, Team.stadium_capacity, Team.latitude,
+            Team.longitude, Team.conference, Team.division
+        ).where(or_(
+            Team.city.is_(None), Team.name.is_(None),
+            Team.abbreviation.is_(None), Team.stadium_name.is_(None),
+            Team.stadium_capacity.is_(None), Team.latitude.is_(None),
+            Team.longitude.is_(None), Team.conference.is_(None),
+            Team.division.is_(None)
+        ))).all()
+
+        missing = defaultdict(list)
+        for t in incomplete_teams:
+            if not t.city:
+                missing["city"].append(t.team_uid)
+            if not t.name:
+                missing["name"].append(t.team_uid)
+            if not t.abbreviation:
+                missing["abbreviation"].append(t.team_uid)
+            if not t.stadium_name:
+                missing["stadium"].append(t.team_uid)
+            if not t.stadium_capacity:
+                missing["capacity"].append(t.team_uid)
+            if not t.latitude or not t.longitude:
+                missing["coordinates"].append(t.team_uid)
+            if not t.conference:
+                missing["conference"].append(t.team_uid)
+            if not t.division:
+                missing["division"].append(t.team_uid)
+
+        for label in ("city", "name", "abbreviation", "stadium", "capacity",
+                      "coordinates", "conference", "division"):
+            if missing[label]:
+                issues.append(f"Teams missing {label}: {missing[label]}")
+
         # Check for expected number of teams (should be 32 NFL teams)
         expected_team_count = 32
-        
-        if len(teams) != expected_team_count:
-            issues.append(f"Expected {expected_team_count} teams, found {len(teams)}")
-        
+
+        if total_teams != expected_team_count:
+            issues.append(f"Expected {expected_team_count} teams, found {total_teams}")
+
         # Check for teams with TheSportsDB UIDs (this is correct - our primary system)
-        thesportsdb_teams = [t for t in teams if t.team_uid.startswith("NFL_")]
-        if len(thesportsdb_teams) != 32:
-            issues.append(f"Not all teams using TheSportsDB UIDs: {len(thesportsdb_teams)}/32")
+        if thesportsdb_teams != 32:
+            issues.append(f"Not all teams using TheSportsDB UIDs: {thesportsdb_teams}/32")
         else:
             print("✅ All teams correctly using TheSportsDB UIDs (our primary system)")
         
@@ -110,64 +233,72 @@ def audit_games(seasons=None):
     issues = []
     
     with SessionLocal() as db:
-        # Total games by season
+        # One grouped query returns every season/type/month bucket at once,
+        # replacing four COUNT round trips per season
+        bucket_rows = db.query(
+            Game.season,
+            Game.game_type,
+            extract('month', Game.game_datetime).label('mo'),
+            func.count()
+        ).filter(Game.season.in_(SEASONS_PARAM)).group_by(
+            Game.season, Game.game_type, 'mo'
+        ).params(seasons=seasons).all()
+
+        season_counts = {s: {"total": 0, "regular": 0, "playoff": 0, "preseason": 0}
+                         for s in seasons}
+        for season, game_type, month, count in bucket_rows:
+            counts = season_counts[season]
+            counts["total"] += count
+            if game_type == "regular":
+                counts["regular"] += count
+            elif game_type == "playoff":
+                counts["playoff"] += count
+            if month == 8:
+                counts["preseason"] += count
+
         for season in seasons:
-            total_games = db.query(Game).filter(Game.season == season).count()
-            regular_games = db.query(Game).filter(
-                Game.season == season,
-                Game.game_type == "regular"
-            ).count()
-            playoff_games = db.query(Game).filter(
-                Game.season == season,
-                Game.game_type == "playoff"
-            ).count()
-            preseason_games = db.query(Game).filter(
-                Game.season == season,
-                extract('month', Game.game_datetime) == 8
-            ).count()
-            
+            counts = season_counts[season]
+
             print(f"\n{season} Season:")
-            print(f"   Total games: {total_games}")
-            print(f"   Regular season: {regular_games}")
-            print(f"   Playoff games: {playoff_games}")
-            print(f"   Preseason games: {preseason_games}")
-            
+            print(f"   Total games: {counts['total']}")
+            print(f"   Regular season: {counts['regular']}")
+            print(f"   Playoff games: {counts['playoff']}")
+            print(f"   Preseason games: {counts['preseason']}")
+
             # Expected: 272 regular season games (17 weeks × 32 teams ÷ 2)
-            if regular_games < 270:  # Allow some flexibility
-                issues.append(f"{season}: Only {regular_games} regular season games (expected ~272)")
-        
-        # Games with missing essential data
-        games_missing_datetime = db.query(Game).filter(
-            Game.season.in_(seasons),
-            Game.game_datetime.is_(None)
-        ).count()
-        
-        games_missing_teams = db.query(Game).filter(
-            Game.season.in_(seasons),
-            and_(Game.home_team_uid.is_(None), Game.away_team_uid.is_(None))
-        ).count()
-        
-        games_missing_scores = db.query(Game).filter(
-            Game.season.in_(seasons),
-            Game.game_datetime.isnot(None),  # Completed games
-            and_(Game.home_score.is_(None), Game.away_score.is_(None))
-        ).count()
-        
-        games_missing_attendance = db.query(Game).filter(
-            Game.season.in_(seasons),
-            Game.attendance.is_(None)
-        ).count()
-        
-        games_missing_venue = db.query(Game).filter(
-            Game.season.in_(seasons),
-            Game.venue.is_(None)
-        ).count()
-        
-        games_missing_weather = db.query(Game).filter(
-            Game.season.in_(seasons),
-            Game.weather_temp.is_(None)
-        ).count()
+            if counts["regular"] < 270:  # Allow some flexibility
+                issues.append(f"{season}: Only {counts['regular']} regular season games (expected ~272)")
         
+        # Games with missing or impossible data: one SUM(CASE) scan instead of
+        # eight COUNT queries over the same season filter
+        def _flag(condition):
+            return func.sum(case((condition, 1), else_=0))
+
+        missing_row = db.query(
+            _flag(Game.game_datetime.is_(None)).label("missing_datetime"),
+            _flag(and_(Game.home_team_uid.is_(None),
+                       Game.away_team_uid.is_(None))).label("missing_teams"),
+            _flag(and_(Game.game_datetime.isnot(None),  # Completed games
+                       Game.home_score.is_(None),
+                       Game.away_score.is_(None))).label("missing_scores"),
+            _flag(Game.attendance.is_(None)).label("missing_attendance"),
+            _flag(Game.venue.is_(None)).label("missing_venue"),
+            _flag(Game.weather_temp.is_(None)).label("missing_weather"),
+            _flag(and_(Game.home_score < 0,
+                       Game.away_score < 0)).label("negative_scores"),
+            _flag(and_(Game.game_datetime > func.now(),
+                       Game.home_score.isnot(None),
+                       Game.away_score.isnot(None))).label("future_with_scores"),
+        ).filter(Game.season.in_(SEASONS_PARAM)).params(seasons=seasons).one()
+
+        games_missing_datetime = missing_row.missing_datetime or 0
+        games_missing_teams = missing_row.missing_teams or 0
+        games_missing_scores = missing_row.missing_scores or 0
+        games_missing_attendance = missing_row.missing_attendance or 0
+        games_missing_venue = missing_row.missing_venue or 0
+        games_missing_weather = missing_row.missing_weather or 0
+
+
         # Report missing data
         if games_missing_datetime:
             issues.append(f"Games missing datetime: {games_missing_datetime}")
@@ -187,22 +318,15 @@ def audit_games(seasons=None):
         if games_missing_weather:
             issues.append(f"Games missing weather: {games_missing_weather}")
         
-        # Check for impossible/inconsistent data
-        games_with_negative_scores = db.query(Game).filter(
-            Game.season.in_(seasons),
-            and_(Game.home_score < 0, Game.away_score < 0)
-        ).count()
-        
+        # Impossible/inconsistent data (from the same aggregate row)
+        games_with_negative_scores = missing_row.negative_scores or 0
+
         if games_with_negative_scores:
             issues.append(f"Games with negative scores: {games_with_negative_scores}")
-        
+
         # Games in the future that have scores (suspicious)
-        future_games_with_scores = db.query(Game).filter(
-            Game.season.in_(seasons),
-            Game.game_datetime > datetime.now(),
-            and_(Game.home_score.isnot(None), Game.away_score.isnot(None))
-        ).count()
-        
+        future_games_with_scores = missing_row.future_with_scores or 0
+
         if future_games_with_scores:
             issues.append(f"Future games with scores (suspicious): {future_games_with_scores}")
         
@@ -230,66 +354,72 @@ def audit_team_statistics(seasons=None):
     with SessionLocal() as db:
         # Game statistics coverage
         print("\nTEAM GAME STATISTICS:")
-        
+
+        # One LEFT JOIN + GROUP BY returns critical games, games with stats
+        # and stat-record counts for every season at once, replacing three
+        # round trips per season
+        non_preseason = or_(*[and_(Game.season == s, _outside_august(s))
+                              for s in seasons])
+        coverage_rows = db.query(
+            Game.season,
+            func.count(func.distinct(case((non_preseason, Game.game_uid)))),
+            func.count(func.distinct(case(
+                (and_(TeamGameStat.game_uid.isnot(None), non_preseason), Game.game_uid)
+            ))),
+            func.count(TeamGameStat.stat_uid)
+        ).outerjoin(
+            TeamGameStat, TeamGameStat.game_uid == Game.game_uid
+        ).filter(Game.season.in_(SEASONS_PARAM)).group_by(
+            Game.season).params(seasons=seasons).all()
+        coverage_by_season = {row[0]: row[1:] for row in coverage_rows}
+
         for season in seasons:
-            # Critical games (excluding preseason)
-            critical_games = db.query(Game).filter(
-                Game.season == season,
-                Game.game_datetime.isnot(None),
-                ~(extract('month', Game.game_datetime) == 8)  # Exclude August preseason
-            ).count()
-            
-            # Games with statistics
-            games_with_stats = db.query(Game).join(TeamGameStat).filter(
-                Game.season == season,
-                ~(extract('month', Game.game_datetime) == 8)
-            ).distinct().count()
-            
-            # Team game stat records
-            team_stat_records = db.query(TeamGameStat).join(Game).filter(
-                Game.season == season
-            ).count()
-            
+            critical_games, games_with_stats, team_stat_records = \
+                coverage_by_season.get(season, (0, 0, 0))
+
             coverage = (games_with_stats / critical_games * 100) if critical_games > 0 else 0
-            
+
             print(f"   {season}: {games_with_stats}/{critical_games} games ({coverage:.1f}% coverage)")
             print(f"           {team_stat_records} team stat records")
-            
+
             if coverage < 85:
                 issues.append(f"{season}: Low game statistics coverage ({coverage:.1f}%)")
-        
+
         # Season statistics coverage
         print("\nTEAM SEASON STATISTICS:")
-        
-        total_teams = db.query(Team).count()
-        
+
+        total_teams = db.execute(select(func.count()).select_from(Team)).scalar()
+
+        season_stat_counts = dict(db.query(
+            TeamSeasonStat.season, func.count()
+        ).filter(TeamSeasonStat.season.in_(SEASONS_PARAM)).group_by(
+            TeamSeasonStat.season).params(seasons=seasons).all())
+
         for season in seasons:
-            season_stats = db.query(TeamSeasonStat).filter(
-                TeamSeasonStat.season == season
-            ).count()
-            
+            season_stats = season_stat_counts.get(season, 0)
+
             coverage = (season_stats / total_teams * 100) if total_teams > 0 else 0
-            
+
             print(f"   {season}: {season_stats}/{total_teams} teams ({coverage:.1f}% coverage)")
-            
+
             if coverage < 90:
                 issues.append(f"{season}: Low season statistics coverage ({coverage:.1f}%)")
         
         # Check for inconsistent statistics
-        invalid_stats = db.query(TeamGameStat).filter(
+        invalid_stats = db.execute(select(func.count()).select_from(TeamGameStat).where(
             and_(
                 TeamGameStat.total_yards.isnot(None),
                 TeamGameStat.total_yards < 0
             )
-        ).count()
+        )).scalar()
         
         if invalid_stats > 0:
             issues.append(f"Team game stats with negative total yards: {invalid_stats}")
         
         # Check for missing essential stats
-        stats_missing_yards = db.query(TeamGameStat).filter(
+        stats_missing_yards = db.execute(select(func.count()).select_from(TeamGameStat).where(
             TeamGameStat.total_yards.is_(None)
-        ).count()
+        )).scalar()
         
         if stats_missing_yards > 0:
             issues.append(f"Team game stats missing total yards: {stats_missing_yards}")
@@ -314,57 +444,67 @@ def analyze_missing_critical_games(seasons=None):
         seasons = [2022, 2023, 2024]
     
     with SessionLocal() as db:
-        # Find critical games without statistics
-        missing_games = db.query(Game).filter(
-            ~Game.game_uid.in_(
-                db.query(TeamGameStat.game_uid).distinct()
-            ),
-            Game.season.in_(seasons),
-            Game.game_datetime.isnot(None),
-            ~(extract('month', Game.game_datetime) == 8)  # Exclude preseason
-        ).order_by(Game.game_datetime).all()
-        
-        if not missing_games:
+        # Find critical games without statistics via a LEFT JOIN anti-join;
+        # NOT IN would materialize the whole TeamGameStat uid set first.
+        # Only counts, groupings and a 10-row sample are reported, so the
+        # aggregation stays in SQL and no ORM entities are ever hydrated
+        def _missing_select(*cols):
+            return select(*cols).select_from(Game).outerjoin(
+                TeamGameStat, TeamGameStat.game_uid == Game.game_uid
+            ).where(
+                TeamGameStat.game_uid.is_(None),
+                Game.game_datetime.isnot(None),
+                # Per-season date windows keep the preseason exclusion sargable
+                or_(*[and_(Game.season == s, _outside_august(s)) for s in seasons])
+            )
+
+        total_missing = db.execute(_missing_select(func.count())).scalar()
+
+        if not total_missing:
             print("✅ No critical games are missing statistics!")
-            return []
-        
-        print(f"Found {len(missing_games)} critical games missing statistics:")
+            return 0
+
+        print(f"Found {total_missing} critical games missing statistics:")
         print()
-        
-        # Group by season and type
-        by_season = defaultdict(list)
-        by_type = defaultdict(list)
-        
-        for game in missing_games:
-            by_season[game.season].append(game)
-            by_type[game.game_type].append(game)
-        
+
         # Show breakdown
         print("BY SEASON:")
-        for season in sorted(by_season.keys()):
-            games = by_season[season]
-            print(f"   {season}: {len(games)} games")
-        
+        for season, count in db.execute(
+            _missing_select(Game.season, func.count())
+            .group_by(Game.season).order_by(Game.season)
+        ):
+            print(f"   {season}: {count} games")
+
         print("\nBY TYPE:")
-        for game_type in sorted(by_type.keys()):
-            games = by_type[game_type]
-            print(f"   {game_type}: {len(games)} games")
-        
+        for game_type, count in db.execute(
+            _missing_select(Game.game_type, func.count())
+            .group_by(Game.game_type).order_by(Game.game_type)
+        ):
+            print(f"   {game_type}: {count} games")
+
         print(f"\nSAMPLE MISSING GAMES:")
-        for game in missing_games[:10]:
-            with SessionLocal() as db:
-                home_team = db.query(Team).filter(Team.team_uid == game.home_team_uid).first()
-                away_team = db.query(Team).filter(Team.team_uid == game.away_team_uid).first()
-                
-                home_name = f"{home_team.city} {home_team.name}" if home_team else game.home_team_uid
-                away_name = f"{away_team.city} {away_team.name}" if away_team else game.away_team_uid
-                
-                print(f"   {away_name} @ {home_name} ({game.game_datetime.date()}) - {game.game_type}")
-        
-        if len(missing_games) > 10:
-            print(f"   ... and {len(missing_games) - 10} more")
-        
-        return missing_games
+        # Resolve team names from the memoised index instead of querying per
+        # game; mappings() keeps the sample rows as plain dicts
+        sample = db.execute(
+            _missing_select(Game.home_team_uid, Game.away_team_uid,
+                            Game.game_datetime, Game.game_type)
+            .order_by(Game.game_datetime).limit(10)
+        ).mappings().all()
+        teams_by_uid = _team_index()
+
+        for game in sample:
+            home_team = teams_by_uid.get(game["home_team_uid"])
+            away_team = teams_by_uid.get(game["away_team_uid"])
+
+            home_name = f"{home_team['city']} {home_team['name']}" if home_team else game["home_team_uid"]
+            away_name = f"{away_team['city']} {away_team['name']}" if away_team else game["away_team_uid"]
+
+            print(f"   {away_name} @ {home_name} ({game['game_datetime'].date()}) - {game['game_type']}")
+
+        if total_missing > 10:
+            print(f"   ... and {total_missing - 10} more")
+
+        return total_missing
 
 def audit_data_quality(seasons=None, detailed=False):
     """Check for data quality issues and anomalies"""
@@ -378,75 +518,43 @@ def audit_data_quality(seasons=None, detailed=False):
     issues = []
     
     with SessionLocal() as db:
-        # Check for duplicate games
-        duplicate_games = db.query(
-            Game.home_team_uid,
-            Game.away_team_uid,
-            Game.game_datetime,
-            func.count(Game.game_uid).label('count')
-        ).filter(
-            Game.season.in_(seasons)
-        ).group_by(
-            Game.home_team_uid,
-            Game.away_team_uid,
-            Game.game_datetime
-        ).having(func.count(Game.game_uid) > 1).all()
-        
-        if duplicate_games:
-            issues.append(f"Duplicate games found: {len(duplicate_games)} sets")
-        
-        # Check for games with same teams playing each other
-        self_playing_games = db.query(Game).filter(
-            Game.season.in_(seasons),
-            Game.home_team_uid == Game.away_team_uid
-        ).count()
+        # Check for duplicate games - only the number of duplicated sets is
+        # reported, so count them in the database instead of shipping every
+        # offending (home, away, datetime) triple back to Python
+        duplicate_count = db.execute(
+            _DUPLICATE_SETS_STMT, {"seasons": seasons}
+        ).scalar()
+
+        if duplicate_count:
+            issues.append(f"Duplicate games found: {duplicate_count} sets")
         
+        # Check for games with same teams playing each other; only presence
+        # matters, so EXISTS lets the DB stop at the first offending row
+        self_playing_games = db.execute(_SELF_PLAYING_STMT, {"seasons": seasons}).scalar()
+
         if self_playing_games:
-            issues.append(f"Games where team plays itself: {self_playing_games}")
+            issues.append("Games where team plays itself detected")
         
         # Check for unrealistic scores
-        high_scoring_games = db.query(Game).filter(
-            Game.season.in_(seasons),
-            and_(
-                Game.home_score.isnot(None),
-                Game.away_score.isnot(None),
-                (Game.home_score + Game.away_score) > 100
-            )
-        ).count()
+        high_scoring_games = db.execute(_HIGH_SCORING_STMT, {"seasons": seasons}).scalar()
         
         if high_scoring_games:
             issues.append(f"Games with combined score > 100: {high_scoring_games}")
         
         # Check for games with no score
-        no_score_games = db.query(Game).filter(
-            Game.season.in_(seasons),
-            Game.game_datetime < datetime.now(),  # Past games
-            and_(
-                Game.home_score.is_(None),
-                Game.away_score.is_(None)
-            )
-        ).count()
+        no_score_games = db.execute(_NO_SCORE_STMT, {"seasons": seasons}).scalar()
         
         if no_score_games:
             issues.append(f"Past games with no scores: {no_score_games}")
         
-        # Check for unrealistic attendance
-        high_attendance_games = db.query(Game).filter(
-            Game.season.in_(seasons),
-            Game.attendance > 150000  # No stadium has this capacity
-        ).count()
-        
+        # Check for unrealistic attendance (presence check, same EXISTS trick)
+        high_attendance_games = db.execute(_HIGH_ATTENDANCE_STMT, {"seasons": seasons}).scalar()
+
         if high_attendance_games:
-            issues.append(f"Games with unrealistic attendance (>150k): {high_attendance_games}")
+            issues.append("Games with unrealistic attendance (>150k) detected")
         
         # Check for missing team references
-        games_with_invalid_teams = db.query(Game).filter(
-            Game.season.in_(seasons),
-            and_(
-                ~Game.home_team_uid.in_(db.query(Team.team_uid)),
-                ~Game.away_team_uid.in_(db.query(Team.team_uid))
-            )
-        ).count()
+        games_with_invalid_teams = db.execute(_INVALID_TEAMS_STMT, {"seasons": seasons}).scalar()
         
         if games_with_invalid_teams:
             issues.append(f"Games referencing non-existent teams: {games_with_invalid_teams}")
@@ -461,7 +569,7 @@ def audit_data_quality(seasons=None, detailed=False):
     
     return issues
 
-def generate_audit_report(team_issues, game_issues, stats_issues, missing_games, quality_issues, seasons):
+def generate_audit_report(team_issues, game_issues, stats_issues, missing_count, quality_issues, seasons):
     """Generate comprehensive audit report with recommendations"""
     print("\n" + "=" * 80)
     print("📋 COMPREHENSIVE AUDIT REPORT")
@@ -470,9 +578,11 @@ def generate_audit_report(team_issues, game_issues, stats_issues, missing_games,
     total_issues = len(team_issues) + len(game_issues) + len(stats_issues) + len(quality_issues)
     
     # Calculate overall health score
-    health_score = max(0, 100 - (total_issues * 5) - (len(missing_games) * 2))
+    health_score = max(0, 100 - (total_issues * 5) - (missing_count * 2))
     
-    report = f"""
+    # Accumulate sections in a list and join once; repeated += on a
+    # growing string reallocates quadratically as the issue lists grow
+    parts = [f"""
 # NFL Database Audit Report
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Seasons Audited: {', '.join(map(str, seasons))}
@@ -484,58 +594,54 @@ Seasons Audited: {', '.join(map(str, seasons))}
 - Game Data Issues: {len(game_issues)}
 - Statistics Issues: {len(stats_issues)}
 - Data Quality Issues: {len(quality_issues)}
-- Missing Critical Games: {len(missing_games)}
+- Missing Critical Games: {missing_count}
 
 ## 🔍 DETAILED FINDINGS
 
 ### Team Data Issues:
-"""
-    
+"""]
+
     if team_issues:
-        for issue in team_issues:
-            report += f"- {issue}\n"
+        parts.extend(f"- {issue}\n" for issue in team_issues)
     else:
-        report += "✅ No team data issues found\n"
-    
-    report += "\n### Game Data Issues:\n"
+        parts.append("✅ No team data issues found\n")
+
+    parts.append("\n### Game Data Issues:\n")
     if game_issues:
-        for issue in game_issues:
-            report += f"- {issue}\n"
+        parts.extend(f"- {issue}\n" for issue in game_issues)
     else:
-        report += "✅ No game data issues found\n"
-    
-    report += "\n### Statistics Issues:\n"
+        parts.append("✅ No game data issues found\n")
+
+    parts.append("\n### Statistics Issues:\n")
     if stats_issues:
-        for issue in stats_issues:
-            report += f"- {issue}\n"
+        parts.extend(f"- {issue}\n" for issue in stats_issues)
     else:
-        report += "✅ No statistics issues found\n"
-    
-    report += "\n### Data Quality Issues:\n"
+        parts.append("✅ No statistics issues found\n")
+
+    parts.append("\n### Data Quality Issues:\n")
     if quality_issues:
-        for issue in quality_issues:
-            report += f"- {issue}\n"
+        parts.extend(f"- {issue}\n" for issue in quality_issues)
     else:
-        report += "✅ No data quality issues found\n"
-    
+        parts.append("✅ No data quality issues found\n")
+
     # Recommendations
-    report += f"""
+    parts.append("""
 
 ## 🎯 RECOMMENDATIONS
 
 ### Priority 1 (Critical):
-"""
-    
-    if len(missing_games) > 50:
-        report += "- Run critical games collector to gather missing statistics\n"
-    
+""")
+
+    if missing_count > 50:
+        parts.append("- Run critical games collector to gather missing statistics\n")
+
     if any("missing" in issue.lower() for issue in team_issues):
-        report += "- Complete missing team information\n"
-    
+        parts.append("- Complete missing team information\n")
+
     if any("score" in issue.lower() for issue in game_issues):
-        report += "- Update missing game scores\n"
-    
-    report += """
+        parts.append("- Update missing game scores\n")
+
+    parts.append("""
 ### Priority 2 (Important):
 - Verify and correct any data quality issues
 - Ensure all venue and attendance data is complete
@@ -564,17 +670,19 @@ Seasons Audited: {', '.join(map(str, seasons))}
    ```
 
 ## 📈 DATABASE READINESS
-"""
-    
+""")
+
     if health_score >= 90:
-        report += "🏆 EXCELLENT - Database is production-ready!\n"
+        parts.append("🏆 EXCELLENT - Database is production-ready!\n")
     elif health_score >= 80:
-        report += "✅ GOOD - Database is ready with minor improvements needed\n"
+        parts.append("✅ GOOD - Database is ready with minor improvements needed\n")
     elif health_score >= 70:
-        report += "⚠️  FAIR - Some issues need attention before production use\n"
+        parts.append("⚠️  FAIR - Some issues need attention before production use\n")
     else:
-        report += "❌ POOR - Significant issues need resolution\n"
-    
+        parts.append("❌ POOR - Significant issues need resolution\n")
+
+    report = "".join(parts)
+
     # Save report
     with open("NFL_DATABASE_AUDIT_REPORT.md", "w") as f:
         f.write(report)
@@ -601,18 +709,50 @@ def main():
     print(f"Auditing seasons: {seasons}")
     print(f"Detailed mode: {args.detailed}")
     print()
-    
-    # Run all audit checks
-    team_issues = audit_teams()
-    game_issues = audit_games(seasons)
-    stats_issues = audit_team_statistics(seasons)
-    missing_games = analyze_missing_critical_games(seasons)
-    quality_issues = audit_data_quality(seasons, args.detailed)
+
+    # Fresh team index for this run
+    _team_index.cache_clear()
+
+
+    # Run all audit checks concurrently - each opens its own session, so the
+    # DB round trips overlap; buffered stdout keeps the output ordered
+    proxy = _ThreadAwareStdout(sys.stdout)
+
+    def run_buffered(fn, *fn_args):
+        buf = io.StringIO()
+        proxy.set_buffer(buf)
+        try:
+            return fn(*fn_args), buf
+        finally:
+            proxy.set_buffer(None)
+
+    audits = [
+        (audit_teams,),
+        (audit_games, seasons),
+        (audit_team_statistics, seasons),
+        (analyze_missing_critical_games, seasons),
+        (audit_data_quality, seasons, args.detailed),
+    ]
+
+    real_stdout = sys.stdout
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=len(audits)) as pool:
+            futures = [pool.submit(run_buffered, *audit) for audit in audits]
+            results = []
+            for future in futures:
+                result, buf = future.result()
+                results.append(result)
+                real_stdout.write(buf.getvalue())
+    finally:
+        sys.stdout = real_stdout
+
+    team_issues, game_issues, stats_issues, missing_count, quality_issues = results
     
     # Generate comprehensive report
     health_score = generate_audit_report(
         team_issues, game_issues, stats_issues, 
-        missing_games, quality_issues, seasons
+        missing_count, quality_issues, seasons
     )
     
     # Return appropriate exit code
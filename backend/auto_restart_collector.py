@@ -4,12 +4,24 @@ Auto-Restart Wrapper for ESPN Stats Collector
 Automatically restarts the collector after timeouts until all data is gathered
 """
 
-import subprocess
+import asyncio
+import random
 import sys
 import time
 import logging
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent))
+
+from espn_overnight_stats_collector import main as collector_main
+
+# Restart tuning: capped exponential backoff instead of a fixed sleep, a
+# watchdog timeout per run, and an overall wall-clock budget
+BASE_DELAY = 2.0            # seconds before the first retry
+MAX_DELAY = 300.0           # cap between restarts
+RUN_TIMEOUT = 2 * 60 * 60   # abort a single hung run after 2 hours
+TOTAL_BUDGET = 12 * 60 * 60  # give up entirely after 12 hours
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,59 +33,83 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _backoff_delay(consecutive_failures):
+    """Capped exponential backoff with jitter.
+
+    A fixed sleep retries too slowly after a transient glitch and hammers
+    the API during a sustained outage; jitter spreads retries out so
+    restarts don't land in lockstep with the provider's rate window.
+    """
+    delay = min(MAX_DELAY, BASE_DELAY * 2 ** consecutive_failures)
+    return delay * random.uniform(0.5, 1.5)
+
+
 def run_collector():
     """Run the ESPN stats collector with automatic restart"""
     restart_count = 0
     max_restarts = 100  # Safety limit
-    
+    consecutive_failures = 0
+    started = time.monotonic()
+
     logger.info("=" * 80)
     logger.info("AUTO-RESTART ESPN STATISTICS COLLECTOR")
     logger.info("=" * 80)
     logger.info("Will automatically restart collector after timeouts until completion")
-    
+
     while restart_count < max_restarts:
+        if time.monotonic() - started > TOTAL_BUDGET:
+            logger.error(f"❌ Wall-clock budget ({TOTAL_BUDGET / 3600:.0f}h) exhausted")
+            return 1
+
         try:
             logger.info(f"Starting collection run #{restart_count + 1}")
-            
-            # Run the collector
-            result = subprocess.run([
-                sys.executable, 
-                "espn_overnight_stats_collector.py"
-            ], 
-            cwd=Path(__file__).parent,
-            capture_output=False,  # Let output stream through
-            timeout=None  # No timeout - let it run
+
+            # Run the collector in-process; each restart reuses the already
+            # imported modules instead of paying interpreter startup and
+            # library import cost for a fresh subprocess. wait_for acts as
+            # the watchdog for a hung run
+            returncode = asyncio.run(
+                asyncio.wait_for(collector_main(), timeout=RUN_TIMEOUT)
             )
-            
-            if result.returncode == 0:
+
+            if returncode == 0:
                 logger.info("🎯 COLLECTION COMPLETED SUCCESSFULLY!")
                 logger.info("All data has been gathered.")
                 break
             else:
-                logger.warning(f"Collector exited with code {result.returncode}")
+                logger.warning(f"Collector exited with code {returncode}")
                 restart_count += 1
-                
-        except subprocess.TimeoutExpired:
+                consecutive_failures += 1
+
+        except asyncio.TimeoutError:
             logger.info("⏰ Collector timed out - restarting automatically...")
             restart_count += 1
-            time.sleep(2)  # Brief pause before restart
-            
+            # A timeout means progress was being made; retry promptly
+            consecutive_failures = 0
+            time.sleep(BASE_DELAY)
+            continue
+
         except KeyboardInterrupt:
             logger.info("🛑 Manual interruption - stopping auto-restart")
             break
-            
+
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
             restart_count += 1
-            time.sleep(5)  # Longer pause on errors
-    
+            consecutive_failures += 1
+
+        if consecutive_failures:
+            delay = _backoff_delay(consecutive_failures)
+            logger.info(f"Backing off {delay:.1f}s after {consecutive_failures} consecutive failure(s)")
+            time.sleep(delay)
+
     if restart_count >= max_restarts:
         logger.error(f"❌ Maximum restart limit ({max_restarts}) reached")
         return 1
-    
+
     logger.info("✅ Auto-restart collector finished")
     return 0
 
 if __name__ == "__main__":
     exit_code = run_collector()
-    sys.exit(exit_code)
\ No newline at end of file
+    sys.exit(exit_code)
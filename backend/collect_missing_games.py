@@ -12,8 +12,9 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
 from espn_overnight_stats_collector import OvernightStatsCollector
-from app.core.database import SessionLocal
-from app.models.sports import Game, Team, TeamGameStat
+from app.core.database import SessionLocal, engine
+from app.models.sports import Game, TeamGameStat
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 # Configure logging
 logging.basicConfig(
@@ -29,18 +30,21 @@ async def collect_only_missing_games():
     games_to_process = []
     
     with SessionLocal() as db:
-        # Get games without team stats
-        games_without_stats = db.query(Game).filter(
-            ~Game.game_uid.in_(
-                db.query(TeamGameStat.game_uid).distinct()
-            ),
+        # Covered game uids come over once as a set; filtering in Python
+        # replaces the correlated NOT IN subquery SQLite would otherwise
+        # re-evaluate against team_game_stats per candidate row
+        covered = {uid for (uid,) in db.query(TeamGameStat.game_uid).distinct()}
+
+        candidates = db.query(
+            Game.game_uid, Game.game_datetime,
+            Game.home_team_uid, Game.away_team_uid
+        ).filter(
             Game.season >= 2022,
             Game.game_datetime.isnot(None)
         ).all()
-        
-        games_to_process = [(g.game_uid, g.game_datetime, g.home_team_uid, g.away_team_uid) 
-                           for g in games_without_stats]
-        
+
+        games_to_process = [row for row in candidates if row.game_uid not in covered]
+
         logger.info(f"Found {len(games_to_process)} games without statistics")
     
     if not games_to_process:
@@ -52,47 +56,75 @@ async def collect_only_missing_games():
         # Don't load previous progress - start fresh
         collector.processed_games = set()
         collector.failed_games = set()
-        
+
         processed_count = 0
-        
-        for game_uid, game_datetime, home_uid, away_uid in games_to_process:
+
+        # Stat rows accumulate across a chunk of games and land in one bulk
+        # insert, converting thousands of tiny write transactions into a
+        # handful of large ones
+        pending_rows = []
+
+        def flush_pending():
+            if not pending_rows:
+                return
+            # Idempotent against the unique (game_uid, team_uid) index, so
+            # a rerun that re-fetches a game can't raise IntegrityError
+            stmt = sqlite_insert(TeamGameStat).on_conflict_do_nothing(
+                index_elements=["game_uid", "team_uid"])
             try:
-                with SessionLocal() as db:
-                    game = db.query(Game).filter(Game.game_uid == game_uid).first()
-                    if not game:
-                        continue
-                    
-                    home_team = db.query(Team).filter(Team.team_uid == home_uid).first()
-                    away_team = db.query(Team).filter(Team.team_uid == away_uid).first()
-                    
-                    if not home_team or not away_team:
-                        continue
-                    
-                    logger.info(f"Processing: {away_team.city} {away_team.name} @ {home_team.city} {home_team.name} ({game_datetime.date()})")
-                    
-                    # Find ESPN game ID
-                    espn_game_id = await collector.find_espn_game_id(game)
-                    
-                    if espn_game_id:
-                        # Collect team game stats
-                        stats_added = await collector.collect_team_game_stats(game, espn_game_id)
-                        
-                        if stats_added > 0:
-                            processed_count += 1
-                            logger.info(f"  ✅ Added {stats_added} team statistics")
-                        else:
-                            logger.warning(f"  ⚠️  No statistics added")
-                    else:
-                        logger.warning(f"  ❌ ESPN game not found")
-                
-                # Save progress every 10 games
-                if processed_count % 10 == 0 and processed_count > 0:
-                    logger.info(f"Progress: {processed_count} games processed")
-                    
+                with engine.begin() as conn:
+                    conn.execute(stmt, pending_rows)
+                logger.info(f"Flushed {len(pending_rows)} stat rows to database")
             except Exception as e:
-                logger.error(f"Error processing game {game_uid}: {e}")
-                continue
-        
+                # A bad batch costs its own rows, not the whole run; the
+                # dropped games stay uncovered and a rerun picks them up
+                logger.error(f"Failed to flush {len(pending_rows)} stat rows: {e}")
+            pending_rows.clear()
+
+        # Up to 8 ESPN fetches in flight; the selected row carries the
+        # game_uid/datetime/team uids the collector reads, so no per-game
+        # Game query is needed
+        sem = asyncio.Semaphore(8)
+        chunk_size = 500
+
+        async def _one(row):
+            """Fetch one game's stat rows; returns [] when unavailable"""
+            async with sem:
+                home_team = collector.teams_by_uid.get(row.home_team_uid)
+                away_team = collector.teams_by_uid.get(row.away_team_uid)
+
+                if not home_team or not away_team:
+                    return []
+
+                try:
+                    espn_game_id = await collector.find_espn_game_id(row)
+
+                    if not espn_game_id:
+                        logger.warning(f"  ❌ ESPN game not found for {row.game_uid}")
+                        return []
+
+                    rows = await collector.fetch_team_game_stat_rows(row, espn_game_id)
+                    if rows:
+                        logger.info(f"  ✅ {away_team.city} {away_team.name} @ {home_team.city} {home_team.name} ({row.game_datetime.date()}) - {len(rows)} stats")
+                    return rows
+
+                except Exception as e:
+                    logger.error(f"Error processing game {row.game_uid}: {e}")
+                    return []
+
+        for start in range(0, len(games_to_process), chunk_size):
+            chunk = games_to_process[start:start + chunk_size]
+            results = await asyncio.gather(*[_one(row) for row in chunk])
+
+            for rows in results:
+                if rows:
+                    pending_rows.extend(rows)
+                    processed_count += 1
+
+            # DB writes stay serialized on the main task between chunks
+            flush_pending()
+            logger.info(f"Progress: {processed_count} games processed")
+
         logger.info(f"\nTotal games processed: {processed_count}")
     
     return 0
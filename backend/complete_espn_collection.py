@@ -30,32 +30,30 @@ async def force_complete_collection():
     logger.info("Checking for games without statistics...")
     
     with SessionLocal() as db:
-        # Get games without team stats
-        games_without_stats = db.query(Game).filter(
-            ~Game.game_uid.in_(
-                db.query(TeamGameStat.game_uid).distinct()
-            ),
+        # Covered game uids come over once as a set; filtering in Python
+        # replaces the correlated NOT IN subquery SQLite would otherwise
+        # re-evaluate against team_game_stats per candidate row
+        covered = {uid for (uid,) in db.query(TeamGameStat.game_uid).distinct()}
+
+        candidates = db.query(Game.game_uid).filter(
             Game.season >= 2022,
             Game.game_datetime.isnot(None)
         ).all()
-        
-        total_remaining = len(games_without_stats)
+
+        total_remaining = sum(1 for (uid,) in candidates if uid not in covered)
         logger.info(f"Found {total_remaining} games without statistics")
-        
+
         if total_remaining == 0:
             logger.info("✅ Already at 100% coverage!")
             return 0
-    
+
     # Create collector and manually set processed games
     async with OvernightStatsCollector() as collector:
         # Load existing progress
         collector.load_progress()
-        
-        # Mark all games with stats as processed
-        with SessionLocal() as db:
-            games_with_stats = db.query(TeamGameStat.game_uid).distinct().all()
-            for (game_uid,) in games_with_stats:
-                collector.processed_games.add(game_uid)
+
+        # Mark all games with stats as processed (reusing the covered set)
+        collector.processed_games.update(covered)
         
         logger.info(f"Marked {len(collector.processed_games)} games as already processed")
         logger.info("Starting collection of remaining games...")
@@ -4,8 +4,10 @@ Comprehensive Game Categorization System
 Properly categorizes preseason, regular season, and playoff games based on multiple criteria
 """
 
+import numpy as np
 import pandas as pd
 import logging
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -13,6 +15,30 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def load_games_csv(data_file: Path) -> pd.DataFrame:
+    """Load the games CSV with compact dtypes.
+
+    game_type as category turns the equality checks and value_counts
+    into integer-code compares instead of object-string work, and week
+    normalizes to one nullable float dtype up front so masks don't have
+    to juggle '', 'nan', and real numbers.
+    """
+    df = pd.read_csv(data_file, dtype={
+        'game_type': 'category',
+        'game_id': 'string',
+        'season': 'Int16',
+    })
+    if 'week' in df.columns:
+        df['week'] = pd.to_numeric(df['week'], errors='coerce').astype('Float32')
+    return df
+
+
+@lru_cache(maxsize=None)
+def _parse_game_date(game_date: str) -> datetime:
+    """Memoized date parse - slates share dates, so each string parses once"""
+    return datetime.strptime(game_date, '%Y-%m-%d')
+
+
 def categorize_game_comprehensive(game_date: str, week: str, season: int) -> str:
     """
     Comprehensive game categorization based on date, week, and season context
@@ -29,7 +55,7 @@ def categorize_game_comprehensive(game_date: str, week: str, season: int) -> str
     """
     try:
         # Parse date
-        date_obj = datetime.strptime(game_date, '%Y-%m-%d')
+        date_obj = _parse_game_date(game_date)
         month = date_obj.month
         day = date_obj.day
         
@@ -89,7 +115,7 @@ def analyze_all_game_types():
         return
     
     # Load data
-    df = pd.read_csv(data_file)
+    df = load_games_csv(data_file)
     logger.info(f"Loaded {len(df)} total games")
     
     # Analyze current categorization
@@ -101,8 +127,10 @@ def analyze_all_game_types():
     # Analyze games by date patterns
     logger.info("\nAnalyzing by date patterns:")
     
-    # Check for potential preseason games
-    df['date_obj'] = pd.to_datetime(df['date'])
+    # Check for potential preseason games. Pinning the format skips
+    # pandas' per-element inference and cache=True memoizes repeated
+    # dates (each slate date appears many times)
+    df['date_obj'] = pd.to_datetime(df['date'], format='%Y-%m-%d', cache=True)
     df['month'] = df['date_obj'].dt.month
     df['day'] = df['date_obj'].dt.day
     
@@ -114,66 +142,118 @@ def analyze_all_game_types():
     early_sept_games = df[(df['month'] == 9) & (df['day'] <= 10)]
     logger.info(f"Early September games (1-10): {len(early_sept_games)} (check for preseason)")
     
-    # Games with empty weeks
-    empty_week_games = df[df['week'].isna() | (df['week'] == '') | (df['week'] == 'nan')]
+    # Games with empty weeks (week is numeric after load, so isna covers
+    # the '', 'nan', and missing cases; mask computed once and reused by
+    # the per-season block below)
+    empty_week_mask = df['week'].isna()
+    empty_week_games = df[empty_week_mask]
     logger.info(f"Games with empty weeks: {len(empty_week_games)}")
-    
+
     # Show date range for empty week games
     if len(empty_week_games) > 0:
         empty_week_dates = empty_week_games['date'].unique()
         logger.info(f"Empty week game date range: {min(empty_week_dates)} to {max(empty_week_dates)}")
-    
-    # Analyze by season
+
+    # Analyze by season: one grouped aggregation produces the full
+    # season x month breakdown, instead of re-filtering the whole frame
+    # and re-grouping once per season
     logger.info("\nAnalysis by season:")
-    for season in sorted(df['season'].unique()):
-        season_games = df[df['season'] == season]
-        logger.info(f"\nSeason {season}: {len(season_games)} games")
-        
+    month_names = {8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec', 1: 'Jan', 2: 'Feb'}
+    breakdown = df.groupby(['season', 'month']).size().unstack(fill_value=0)
+    season_totals = breakdown.sum(axis=1)
+    empty_by_season = dict(tuple(empty_week_games.groupby('season')))
+
+    for season in breakdown.index:
+        logger.info(f"\nSeason {season}: {season_totals[season]} games")
+
         # Break down by month
-        monthly_breakdown = season_games.groupby('month').size()
-        for month, count in monthly_breakdown.items():
-            month_names = {8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec', 1: 'Jan', 2: 'Feb'}
-            logger.info(f"  {month_names.get(month, month)}: {count} games")
-        
+        for month, count in breakdown.loc[season].items():
+            if count > 0:
+                logger.info(f"  {month_names.get(month, month)}: {count} games")
+
         # Check for specific patterns
-        season_empty_week = season_games[season_games['week'].isna() | (season_games['week'] == '')]
-        if len(season_empty_week) > 0:
+        season_empty_week = empty_by_season.get(season)
+        if season_empty_week is not None:
             logger.info(f"  Empty week games: {len(season_empty_week)}")
-            for _, game in season_empty_week.iterrows():
-                logger.info(f"    {game['game_id']}: {game['date']} ({game.get('game_type', 'N/A')})")
+            for game_id, date, game_type in season_empty_week[['game_id', 'date', 'game_type']].itertuples(index=False, name=None):
+                logger.info(f"    {game_id}: {date} ({game_type})")
+
+
+def categorize_games_vectorized(df: pd.DataFrame) -> np.ndarray:
+    """Vectorized version of categorize_game_comprehensive.
+
+    Runs the same decision tree as the scalar function, but as boolean
+    masks over whole columns feeding one np.select - no per-row Python
+    dispatch. Rows with unparseable dates keep their current game_type,
+    matching the scalar path's skip of empty dates.
+    """
+    date_obj = pd.to_datetime(df['date'], format='%Y-%m-%d',
+                              errors='coerce', cache=True)
+    valid = date_obj.notna().to_numpy()
+    m = date_obj.dt.month.to_numpy()
+    d = date_obj.dt.day.to_numpy()
+    w = pd.to_numeric(df['week'], errors='coerce').to_numpy(dtype=float)
+    no_week = np.isnan(w)
+
+    is_preseason = (m == 8) | ((m == 9) & (d <= 10) & (no_week | (w <= 0)))
+    is_regular_week = ~no_week & (w >= 1) & (w <= 18)
+
+    # Same precedence as the scalar function: preseason, then week-numbered
+    # regular season, then the empty-week playoff date windows; everything
+    # else (Sep-Dec, early January, unknown) defaults to regular
+    new_types = np.select(
+        [
+            is_preseason,
+            is_regular_week,
+            no_week & (m == 1) & (d >= 13) & (d <= 16),
+            no_week & (m == 1) & (d >= 20) & (d <= 22),
+            no_week & (m == 1) & (d >= 28) & (d <= 31),
+            no_week & (m == 2) & (d >= 8) & (d <= 15),
+        ],
+        ['preseason', 'regular', 'wildcard', 'divisional', 'conference', 'superbowl'],
+        default='regular',
+    ).astype(object)
+
+    current = df['game_type'].to_numpy(dtype=object) if 'game_type' in df else np.full(len(df), '', dtype=object)
+    return np.where(valid, new_types, current)
 
 
 def fix_comprehensive_categorization():
     """Apply comprehensive categorization to all games"""
     logger.info("Applying comprehensive game categorization...")
-    
+
     data_file = Path("data/nfl_games_complete.csv")
-    df = pd.read_csv(data_file)
-    
-    updated_count = 0
+    df = load_games_csv(data_file)
+
+    old_types = df['game_type'].astype(object).fillna('').to_numpy(dtype=object)
+    new_types = categorize_games_vectorized(df)
+
+    changed = new_types != old_types
+    updated_count = int(changed.sum())
+
+    # Per-row "X -> Y" lines are debug-only: at INFO the hot path does no
+    # string formatting or handler I/O for tens of thousands of rows
+    if logger.isEnabledFor(logging.DEBUG):
+        for i in np.flatnonzero(changed):
+            old_type = old_types[i] if old_types[i] else 'empty'
+            logger.debug(f"  {df['game_id'].iat[i]} ({df['date'].iat[i]}): {old_type} -> {new_types[i]}")
+
+    # One crosstab over the changed rows yields the transition counts;
+    # O(#distinct transitions) instead of a dict update per row
     categorization_changes = {}
-    
-    for idx, row in df.iterrows():
-        current_type = row.get('game_type', '')
-        game_date = row.get('date', '')
-        week = row.get('week', '')
-        season = row.get('season', 0)
-        
-        if game_date:
-            new_type = categorize_game_comprehensive(game_date, week, season)
-            
-            # Only update if different from current
-            if new_type != current_type:
-                old_type = current_type if current_type else 'empty'
-                logger.info(f"  {row['game_id']} ({game_date}): {old_type} -> {new_type}")
-                
-                df.at[idx, 'game_type'] = new_type
-                updated_count += 1
-                
-                # Track changes
-                change_key = f"{old_type} -> {new_type}"
-                categorization_changes[change_key] = categorization_changes.get(change_key, 0) + 1
-    
+    if updated_count > 0:
+        old_changed = pd.Series(old_types[changed]).replace('', 'empty')
+        transitions = pd.crosstab(old_changed, pd.Series(new_types[changed]))
+        categorization_changes = {
+            f"{old} -> {new}": int(count)
+            for (old, new), count in transitions.stack().items() if count
+        }
+
+    if updated_count > 0:
+        # Cast the np.select output back to category so downstream
+        # value_counts stays on integer codes
+        df['game_type'] = pd.Categorical(new_types)
+
     # Save updated data
     if updated_count > 0:
         df.to_csv(data_file, index=False)
@@ -199,37 +279,41 @@ def verify_categorization_accuracy():
     logger.info("Verifying categorization accuracy...")
     
     data_file = Path("data/nfl_games_complete.csv")
-    df = pd.read_csv(data_file)
-    
+    df = load_games_csv(data_file)
+
     issues = []
     
-    # Convert date to datetime for analysis
-    df['date_obj'] = pd.to_datetime(df['date'])
+    # Convert date to datetime for analysis (fixed format + cache, as above)
+    df['date_obj'] = pd.to_datetime(df['date'], format='%Y-%m-%d', cache=True)
     df['month'] = df['date_obj'].dt.month
-    
-    for _, row in df.iterrows():
-        game_type = row['game_type']
-        month = row['month']
-        week = row.get('week', '')
-        game_id = row['game_id']
-        
-        # Verify preseason games
-        if game_type == 'preseason':
-            if month not in [8, 9]:
-                issues.append(f"{game_id}: Preseason game not in Aug/Sep ({row['date']})")
-        
-        # Verify regular season games
-        elif game_type == 'regular':
-            if month in [8] and pd.notna(week):
-                issues.append(f"{game_id}: Regular season game in August ({row['date']})")
-            elif month in [2] and row['date_obj'].day > 5:
-                issues.append(f"{game_id}: Regular season game in late February ({row['date']})")
-        
-        # Verify playoff games
-        elif game_type in ['wildcard', 'divisional', 'conference', 'superbowl']:
-            if month not in [1, 2]:
-                issues.append(f"{game_id}: Playoff game not in Jan/Feb ({row['date']})")
-    
+
+    # Each check is a boolean mask over whole columns; iterrows built a
+    # fresh Series per row just to run these comparisons. The masks are
+    # mutually exclusive (distinct game_type / month), so this flags the
+    # same rows as the old per-row elif chain.
+    game_type = df['game_type'].to_numpy(dtype=object)
+    month = df['month'].to_numpy()
+    day = df['date_obj'].dt.day.to_numpy()
+    has_week = df['week'].notna().to_numpy() if 'week' in df else np.zeros(len(df), dtype=bool)
+    game_ids = df['game_id'].to_numpy(dtype=object)
+    dates = df['date'].to_numpy(dtype=object)
+
+    checks = (
+        ((game_type == 'preseason') & ~np.isin(month, (8, 9)),
+         "Preseason game not in Aug/Sep"),
+        ((game_type == 'regular') & (month == 8) & has_week,
+         "Regular season game in August"),
+        ((game_type == 'regular') & (month == 2) & (day > 5),
+         "Regular season game in late February"),
+        (np.isin(game_type, ('wildcard', 'divisional', 'conference', 'superbowl'))
+         & ~np.isin(month, (1, 2)),
+         "Playoff game not in Jan/Feb"),
+    )
+
+    for mask, description in checks:
+        for i in np.flatnonzero(mask):
+            issues.append(f"{game_ids[i]}: {description} ({dates[i]})")
+
     logger.info(f"Verification complete. Found {len(issues)} potential issues:")
     for issue in issues[:10]:  # Show first 10 issues
         logger.info(f"  {issue}")
@@ -35,7 +35,7 @@ def fix_missing_total_yards():
         # Find stats with missing total_yards but with raw data
         missing_yards_stats = db.query(TeamGameStat).filter(
             TeamGameStat.total_yards.is_(None),
-            TeamGameStat.raw_box_score.isnot(None)
+            TeamGameStat.raw_box_score_zlib.isnot(None)
         ).all()
         
         print(f"Found {len(missing_yards_stats)} records missing total_yards")